@@ -0,0 +1,56 @@
+import subprocess
+import statistics
+import sys
+import time
+
+# modules that should only be loaded once a plotting or NLP method is called
+HEAVY_MODULES = ["matplotlib", "gensim", "nltk", "wordcloud", "pandas", "plotly"]
+
+
+def time_import(module, runs=10):
+    """
+
+    :param module: string
+        name of the module to import
+    :param runs: int
+        number of fresh interpreters to time the import in
+    :return: timings: list
+        wall clock seconds for each run
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import " + module], check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def eager_modules(module):
+    """
+
+    :param module: string
+        name of the module to import
+    :return: list
+        heavy modules that were loaded as a side effect of importing the module
+    """
+    check = ("import sys, " + module + "; "
+             "print(' '.join(m for m in " + repr(HEAVY_MODULES) + " if m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", check], check=True, capture_output=True, text=True)
+    return output.stdout.split()
+
+
+def main():
+    baseline = time_import("sys")
+    for module in ["sankey", "nlp_library"]:
+        timings = time_import(module)
+        overhead = statistics.median(timings) - statistics.median(baseline)
+        print(module + ": median " + str(round(statistics.median(timings) * 1000, 1)) + " ms, "
+              + str(round(overhead * 1000, 1)) + " ms over a bare interpreter")
+        loaded = eager_modules(module)
+        if loaded:
+            print(module + " eagerly imports: " + ", ".join(loaded))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,11 @@
 from collections import defaultdict, Counter, OrderedDict
-from matplotlib import pyplot as plt, rcParams
-import string
-from gensim.parsing.preprocessing import remove_stopwords
 import re
-import nltk
-import numpy as np
 import datetime
-from wordcloud import WordCloud, STOPWORDS
-import pandas as pd
 import sankey as sk
 
+# plotting and NLP backends (matplotlib, gensim, nltk, wordcloud, pandas) are imported
+# inside the methods that use them so that importing this module stays fast
+
 VOWELS = ["a", "i", "e", "o", "u", "y", "A", "E", "I", "O", "U", "Y"]
 
 
@@ -149,6 +145,9 @@ class Text:
         :return: dict
             frequencies of parts of speech in the input text
         """
+        import nltk
+        from gensim.parsing.preprocessing import remove_stopwords
+
         speech_parts = []
         for sentence in sentences.split("."):
             sentence = remove_stopwords(sentence).strip()
@@ -169,6 +168,8 @@ class Text:
         :return: results: dict
             holds all data for the given text
         """
+        from gensim.parsing.preprocessing import remove_stopwords
+
         with open(filename, "r", encoding="unicode_escape") as infile:
             lines = infile.readlines()
         # make string for all text in file
@@ -267,6 +268,9 @@ class Text:
         :return: None
             plots word clouds
         """
+        from matplotlib import pyplot as plt
+        from wordcloud import WordCloud
+
         # makes a list of time period ranges that correspond to each word cloud subplot
         periods = range(min_year, max_year, len_time_periods)
         period_nested = [[periods[i], periods[i + 1] - 1] for i in range(len(periods) - 1)]
@@ -347,6 +351,8 @@ class Text:
             3 character string referring to the tricolor needed to map colors, default is "rgb"
         :return: None
         """
+        import pandas as pd
+
         # create empty df with specific column titles
         all_data_df = pd.DataFrame(columns=['title', 'words', 'frequency', 'label', 'year'])
         for group in self.data.keys():
@@ -402,6 +408,8 @@ class Text:
             maximum year included in plot
         :return: None
         """
+        from matplotlib import pyplot as plt
+
         # creates nested lists for x variable and y variable, separate sub-lists for different labels
         vals_dict = defaultdict(dict)
 
@@ -1,5 +1,3 @@
-import plotly.graph_objects as go
-import pandas as pd
 import random
 from collections import defaultdict
 
@@ -79,6 +77,8 @@ def _code_mapping(df, src, targ):
 
 def make_sankey(df, src, targ, label_color_dict=None, tricolor_colormap=None, color_function=None, vals=None, **kwargs):
     """ Generate the sankey diagram """
+    # plotly is slow to import, so only load it once a diagram is actually drawn
+    import plotly.graph_objects as go
 
     original_df = df
     df, labels = _code_mapping(df, src, targ)